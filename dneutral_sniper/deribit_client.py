@@ -1,15 +1,36 @@
 import websockets
 import json
 import asyncio
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        # Deribit's JSON-RPC-over-websocket is a text protocol: decode so
+        # websockets sends text frames, not binary. orjson encode+decode is
+        # still several times faster than stdlib json.dumps.
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 import logging
 from typing import Optional, Callable, Dict
 from dataclasses import dataclass
-import itertools
+import random
 import time
-import traceback
+
+_monotonic_ns = time.monotonic_ns  # Pre-bound: called once per tick on the cache write
 
 logger = logging.getLogger(__name__)
 
+try:
+    # C accelerator for frame masking; without it websockets falls back to a
+    # pure-Python loop that dominates recv cost on a 100ms ticker stream
+    import websockets.speedups  # noqa: F401
+except ImportError:
+    logger.warning("websockets.speedups C extension not available; frame masking will run in pure Python")
+
 @dataclass
 class DeribitCredentials:
     client_id: str
@@ -27,19 +48,64 @@ class DeribitWebsocketClient:
         self.ws_url = self.TESTNET_WS_URL if is_test or (credentials and credentials.test) else self.MAINNET_WS_URL
         self.req_listener_task = None
         self.sub_listener_task = None
-        self.pending_requests = {}  # id -> Future
-        self._id_counter = itertools.count(100)
+        self._pending_slots = [None] * 65536  # Request-id ring: slot index == JSON-RPC id
+        self._next_slot = 100  # Ids below 100 are reserved for fixed frames (auth, subscribe)
         self.last_subscribed_instrument = None
-        self._req_ws_recv_lock = asyncio.Lock()  # Enforce single-consumer recv for req_ws
-        self._sub_ws_recv_lock = asyncio.Lock()  # Enforce single-consumer recv for sub_ws
+        # Invariant: recv() is only ever called from the single listen_req_ws /
+        # listen_sub_ws task per socket, so no recv lock is needed
         self.subscribed_instruments = set()  # Track all currently subscribed instruments
-        self.price_iv_cache = {}  # instrument_name -> {"mark_price": float, "iv": float}
+        self.price_iv_cache = {}  # instrument_name -> (mark_price, iv, timestamp) tuple
+        self._auth_payload = None  # Serialized auth frame, built once per credentials
+        self._pending_subscriptions = set()  # Names queued for the next batched subscribe frame
+        self._subscribe_flush_task = None
+        self._backoff = 0.2  # Current reconnect backoff in seconds, doubles on failure
+        self._auth_done = asyncio.Event()  # Set once the connection is ready for subscribes
+        self._req_send_q: asyncio.Queue = asyncio.Queue()  # Outbound JSON-RPC frames for req_ws
+        self._req_writer_task = None
+        self._last_callback_price = {}  # instrument_name -> last price passed to price_callback
+        self.price_epsilon = 0.0  # Min absolute price move (USD) to re-fire price_callback
+        self._channel_handlers: Dict[str, Callable] = {}  # channel -> handler, filled on subscribe
+        self._channel_name_cache: Dict[str, str] = {}  # instrument_name -> ticker channel name
+        self._inflight_fetches: Dict[str, asyncio.Future] = {}  # Single-flight mark/IV fetches
+        self._reconnect_future: Optional[asyncio.Future] = None  # Single-flight reconnect
+
+    def _channel(self, instrument_name: str) -> str:
+        """Return the (cached) ticker channel name for an instrument."""
+        channel = self._channel_name_cache.get(instrument_name)
+        if channel is None:
+            channel = f"ticker.{instrument_name}.100ms"
+            self._channel_name_cache[instrument_name] = channel
+        return channel
+
+    @staticmethod
+    def _normalize_iv(mark_iv):
+        """Deribit sometimes reports IV in percent; bring it back to a decimal."""
+        if mark_iv is None:
+            return None
+        return mark_iv / 100 if mark_iv > 3 else mark_iv
+
+    def _prune_price_cache(self):
+        """Drop expired entries, then the oldest, to keep the cache bounded.
+
+        Weekly expiries come and go; without a bound the dict grows (and
+        rehashes) for the lifetime of the process.
+        """
+        now = time.monotonic_ns()
+        cache = self.price_iv_cache
+        for name in [n for n, entry in cache.items() if now - entry[2] > self.PRICE_CACHE_TTL_NS]:
+            del cache[name]
+        overflow = len(cache) - self.PRICE_CACHE_MAX
+        if overflow > 0:
+            for name in sorted(cache, key=lambda n: cache[n][2])[:overflow]:
+                del cache[name]
 
     def get_price_iv(self, instrument_name: str):
         """Return (mark_price, iv) for the instrument from cache, or (None, None) if not available."""
         entry = self.price_iv_cache.get(instrument_name)
         if entry:
-            return entry.get("mark_price"), entry.get("iv")
+            # IV is cached raw off the tick path and normalized lazily here,
+            # at read cadence (seconds) rather than tick cadence (100ms)
+            return entry[0], self._normalize_iv(entry[1])
         return None, None
 
     async def subscribe_to_instruments(self, instrument_names):
@@ -50,48 +116,70 @@ class DeribitWebsocketClient:
         new_instruments = set(instrument_names) - self.subscribed_instruments
         if not new_instruments:
             return
-        channels = [f"ticker.{name}.100ms" for name in new_instruments]
+        channels = [self._channel(name) for name in new_instruments]
         subscribe_params = {
             "jsonrpc": "2.0",
             "method": "public/subscribe",
             "id": 42,
             "params": {"channels": channels}
         }
-        await asyncio.sleep(0.5)
-        await self.sub_ws.send(json.dumps(subscribe_params))
-        logger.info(f"Subscribed to tickers: {channels}")
+        for channel in channels:
+            self._channel_handlers[channel] = self._handle_ticker_update
+        await self._auth_done.wait()
+        await self.sub_ws.send(_json_dumps(subscribe_params))
+        logger.info("Subscribed to %d tickers", len(channels))
         self.subscribed_instruments.update(new_instruments)
 
+    def request_subscription(self, instrument_name: str):
+        """
+        Queue an instrument for subscription without awaiting the send.
+        Requests arriving within the flush window are coalesced into a
+        single multi-channel public/subscribe frame.
+        """
+        self._pending_subscriptions.add(instrument_name)
+        if self._subscribe_flush_task is None or self._subscribe_flush_task.done():
+            self._subscribe_flush_task = asyncio.create_task(self._flush_pending_subscriptions())
+
+    async def _flush_pending_subscriptions(self):
+        await asyncio.sleep(0.02)  # Let nearby requests accumulate into one frame
+        pending = self._pending_subscriptions
+        self._pending_subscriptions = set()
+        if pending:
+            await self.subscribe_to_instruments(pending)
+
 
 
     TESTNET_WS_URL = "wss://test.deribit.com/ws/api/v2"
     MAINNET_WS_URL = "wss://www.deribit.com/ws/api/v2"
 
-    def _old_init(self, credentials: Optional[DeribitCredentials] = None):
-        self.credentials = credentials
-        self.req_ws: Optional[websockets.WebSocketClientProtocol] = None  # For request/response
-        self.sub_ws: Optional[websockets.WebSocketClientProtocol] = None  # For subscriptions
-        self.price_callback: Optional[Callable[[str, float], None]] = None
-        self.running = False
-        self.ws_url = self.TESTNET_WS_URL if credentials and credentials.test else self.MAINNET_WS_URL
-        self.req_listener_task = None
-        self.sub_listener_task = None
-        self.pending_requests = {}  # id -> Future
-        self._id_counter = itertools.count(100)
-        self.last_subscribed_instrument = None
-        self._req_ws_recv_lock = asyncio.Lock()  # Enforce single-consumer recv for req_ws
-        self._sub_ws_recv_lock = asyncio.Lock()  # Enforce single-consumer recv for sub_ws
+    # Deribit ticker frames are small JSON blobs: permessage-deflate costs more
+    # CPU per frame than the bandwidth it saves, and max_size=None skips the
+    # per-frame length cap check. Revisit if the server starts sending large
+    # compressed snapshots.
+    _CONNECT_KWARGS = dict(
+        compression=None,
+        max_size=None,
+        ping_interval=20,
+        ping_timeout=10,
+        close_timeout=2,
+        max_queue=64,
+    )
 
     async def connect(self):
         """Connect both request/response and subscription websockets"""
-        self.req_ws = await websockets.connect(self.ws_url)
-        self.sub_ws = await websockets.connect(self.ws_url)
+        self.req_ws = await websockets.connect(self.ws_url, **self._CONNECT_KWARGS)
+        self.sub_ws = await websockets.connect(self.ws_url, **self._CONNECT_KWARGS)
         if self.credentials:
             await self._authenticate(self.req_ws)
             await self._authenticate(self.sub_ws)
+        # Frames are processed by the server in send order, so once the auth
+        # frames are on the wire subscribes may follow without a fixed delay
+        self._auth_done.set()
         self.running = True
         if self.req_listener_task is None or self.req_listener_task.done():
             self.req_listener_task = asyncio.create_task(self.listen_req_ws())
+        if self._req_writer_task is None or self._req_writer_task.done():
+            self._req_writer_task = asyncio.create_task(self._write_req_ws())
         if self.sub_listener_task is None or self.sub_listener_task.done():
             self.sub_listener_task = asyncio.create_task(self.listen_sub_ws())
             logger.info("Started sub_ws listener task")
@@ -100,73 +188,92 @@ class DeribitWebsocketClient:
         """Authenticate a websocket connection if credentials are provided"""
         if not self.credentials:
             return
-        auth_params = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "public/auth",
-            "params": {
-                "grant_type": "client_credentials",
-                "client_id": self.credentials.client_id,
-                "client_secret": self.credentials.client_secret
+        if self._auth_payload is None:
+            auth_params = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "public/auth",
+                "params": {
+                    "grant_type": "client_credentials",
+                    "client_id": self.credentials.client_id,
+                    "client_secret": self.credentials.client_secret
+                }
             }
-        }
-        await ws.send(json.dumps(auth_params))
+            self._auth_payload = _json_dumps(auth_params)
+        await ws.send(self._auth_payload)
         # Optionally wait for auth response, but Deribit allows unauthenticated public access
 
-    async def send_request(self, method: str, params: dict) -> dict:
-        """Send JSON-RPC request via req_ws and await response via req_ws listener"""
-        req_id = next(self._id_counter)
-        request = {
-            "jsonrpc": "2.0",
-            "id": req_id,
-            "method": method,
-            "params": params
-        }
-        fut = asyncio.get_running_loop().create_future()
-        self.pending_requests[req_id] = fut
-        await self.req_ws.send(json.dumps(request))
-        try:
-            response = await asyncio.wait_for(fut, timeout=10)
-            return response
-        finally:
-            self.pending_requests.pop(req_id, None)
+    def _acquire_slot(self) -> int:
+        """Find a free request id by probing the slot ring from the last position.
+
+        Bounded small-int ids hash fast, serialize short, and index the slot
+        list directly instead of paying a dict insert/pop per request.
+        """
+        slots = self._pending_slots
+        idx = self._next_slot
+        for _ in range(len(slots)):
+            idx += 1
+            if idx >= len(slots):
+                idx = 100
+            if slots[idx] is None:
+                self._next_slot = idx
+                return idx
+        raise RuntimeError("All request id slots are in flight")
+
+    async def _write_req_ws(self):
+        """Single writer for req_ws: drains queued frames back-to-back so one
+        event-loop wakeup serves every request pending in the same turn."""
+        while self.running:
+            entry = await self._req_send_q.get()
+            batch = [entry]
+            while not self._req_send_q.empty() and len(batch) < 32:
+                batch.append(self._req_send_q.get_nowait())
+            try:
+                for _, frame in batch:
+                    await self.req_ws.send(frame)
+            except Exception as e:
+                logger.error("Error sending queued request: %s", e)
+                # Fail the whole batch's futures now instead of letting each
+                # caller burn its full response timeout on a frame that never
+                # (or may never have) hit the wire
+                for req_id, _ in batch:
+                    fut = self._pending_slots[req_id]
+                    if fut is not None and not fut.done():
+                        fut.set_exception(e)
 
     async def subscribe_to_ticker(self, instrument_name: str):
-        """Subscribe to ticker updates using sub_ws and remember for reconnects"""
+        """Subscribe to one ticker; thin shim over the batched subscribe path"""
         self.last_subscribed_instrument = instrument_name
-        subscribe_params = {
-            "jsonrpc": "2.0",
-            "method": "public/subscribe",
-            "id": 2,
-            "params": {
-                "channels": [f"ticker.{instrument_name}.100ms"]
-            }
-        }
-        await asyncio.sleep(0.5)
-        await self.sub_ws.send(json.dumps(subscribe_params))
-        logger.info(f"Sent subscription request: {subscribe_params}")
+        await self.subscribe_to_instruments((instrument_name,))
 
     async def listen_req_ws(self):
         """Listen for responses to requests on req_ws"""
         backoff = 1
+        # Hot loop: bind frequently used names as locals once
+        loads = _json_loads
+        slots = self._pending_slots
         while self.running:
             try:
-                async with self._req_ws_recv_lock:
-                    message = await self.req_ws.recv()
-                data = json.loads(message)
+                message = await self.req_ws.recv()
+                if len(message) > self.LARGE_RESPONSE_BYTES:
+                    # Big book summaries should not stall ticker processing;
+                    # orjson releases the GIL so the decode runs in parallel
+                    data = await asyncio.to_thread(loads, message)
+                else:
+                    data = loads(message)
                 req_id = data.get("id")
-                if req_id is not None and req_id in self.pending_requests:
-                    fut = self.pending_requests[req_id]
-                    if not fut.done():
+                if isinstance(req_id, int) and 100 <= req_id < len(slots):
+                    fut = slots[req_id]
+                    if fut is not None and not fut.done():
                         fut.set_result(data)
                 backoff = 1
             except (websockets.exceptions.ConnectionClosed, websockets.exceptions.ConnectionClosedError, websockets.exceptions.ConnectionClosedOK) as e:
-                logger.error(f"req_ws closed: {e}. Attempting to reconnect in {backoff}s...")
+                logger.error("req_ws closed: %s. Attempting to reconnect in %ss...", e, backoff)
                 await asyncio.sleep(backoff)
                 await self.reconnect()
                 backoff = min(backoff * 2, 60)
             except Exception as e:
-                logger.error(f"Error in req_ws listener: {e}")
+                logger.error("Error in req_ws listener: %s", e)
                 await asyncio.sleep(backoff)
                 await self.reconnect()
                 backoff = min(backoff * 2, 60)
@@ -175,46 +282,114 @@ class DeribitWebsocketClient:
         """Listen for subscription messages on sub_ws"""
         logger.info("listen_sub_ws() STARTED")
         backoff = 1
+        # Hot loop: bind frequently used names as locals once (LOAD_FAST is
+        # much cheaper than repeated attribute/global lookups per frame)
+        loads = _json_loads
+        handle = self._handle_message
+        get_handler = self._channel_handlers.get
         while self.running:
             try:
-                try:
-                    async with self._sub_ws_recv_lock:
-                        message = await asyncio.wait_for(self.sub_ws.recv(), timeout=10)
-                    data = json.loads(message)
-                    await self._handle_message(data)
-                    backoff = 1
-                except asyncio.TimeoutError:
-                    logger.warning("No message received on sub_ws after 10 seconds!")
+                # Dead peers surface as ConnectionClosed via the protocol-level
+                # ping/pong keepalive, so no recv timeout wrapper is needed
+                message = await self.sub_ws.recv()
+                # Cheap substring prefilter: only ticker subscription frames
+                # carrying a mark_price can drive the price callback, so skip
+                # the full JSON parse for acks/heartbeats/other frames.
+                if isinstance(message, bytes):
+                    if b'"subscription"' not in message or b'"mark_price"' not in message:
+                        continue
+                elif '"subscription"' not in message or '"mark_price"' not in message:
                     continue
+                if len(message) > self.LARGE_FRAME_BYTES:
+                    # orjson releases the GIL while parsing, so decoding a
+                    # big batched frame off-thread keeps the loop responsive
+                    data = await asyncio.to_thread(loads, message)
+                else:
+                    data = loads(message)
+                # Fast path: the prefilter guarantees this is a subscription
+                # frame, so dispatch straight off params without the generic
+                # _handle_message indirection (one call fewer per tick)
+                params = data.get("params")
+                if params:
+                    handler = get_handler(params.get("channel"))
+                    if handler:
+                        handler(params.get("data", {}))
+                else:
+                    handle(data)
+                backoff = 1
             except (websockets.exceptions.ConnectionClosed, websockets.exceptions.ConnectionClosedError, websockets.exceptions.ConnectionClosedOK) as e:
-                logger.error(f"sub_ws closed: {e}. Attempting to reconnect in {backoff}s...")
+                logger.error("sub_ws closed: %s. Attempting to reconnect in %ss...", e, backoff)
                 await asyncio.sleep(backoff)
                 await self.reconnect()
                 backoff = min(backoff * 2, 60)
             except Exception as e:
-                logger.error(f"Error in sub_ws listener: {e}")
+                logger.error("Error in sub_ws listener: %s", e)
                 await asyncio.sleep(backoff)
                 await self.reconnect()
                 backoff = min(backoff * 2, 60)
 
+    RECONNECT_MAX_RETRIES = 10
+    LARGE_FRAME_BYTES = 4096  # Frames above this are JSON-decoded off the loop thread
+    LARGE_RESPONSE_BYTES = 16384  # req_ws responses above this decode off-thread
+    PRICE_CACHE_MAX = 2048  # Max instruments kept in price_iv_cache
+    PRICE_CACHE_TTL_NS = 3600 * 1_000_000_000  # Nanoseconds before a cache entry counts as stale
+
     async def reconnect(self):
-        """Reconnect both websockets on connection loss and restore callbacks/subscriptions."""
-        logger.info("Attempting to reconnect...")
+        """Reconnect both websockets with exponential backoff and restore callbacks/subscriptions.
+
+        Single-flight: both listeners (and the RPC error path) call this when
+        the network drops, and concurrent attempts would race connect() and
+        orphan half the fresh sockets — late callers just await the attempt
+        already in progress.
+        """
+        if self._reconnect_future is not None:
+            await self._reconnect_future
+            return
+        self._reconnect_future = asyncio.get_running_loop().create_future()
         try:
-            await self.connect()
+            await self._reconnect_once()
+        finally:
+            fut = self._reconnect_future
+            self._reconnect_future = None
+            fut.set_result(None)
+
+    async def _reconnect_once(self):
+        # Fail all in-flight RPCs up front: their responses died with the old
+        # socket, and leaving the futures pending would leak them on timeout
+        for req_id, fut in enumerate(self._pending_slots):
+            if fut is not None:
+                if not fut.done():
+                    fut.set_exception(ConnectionResetError("websocket reconnecting"))
+                self._pending_slots[req_id] = None
+        for attempt in range(1, self.RECONNECT_MAX_RETRIES + 1):
+            # Exponential backoff with jitter so a flapping server is not hammered
+            await asyncio.sleep(self._backoff + random.uniform(0, self._backoff * 0.2))
+            logger.info("Reconnect attempt %d/%d...", attempt, self.RECONNECT_MAX_RETRIES)
+            try:
+                await self.connect()
+            except Exception as e:
+                logger.error("Reconnection failed: %s", e)
+                self._backoff = min(self._backoff * 2, 30.0)
+                continue
+            self._backoff = 0.2
             # Restore price callback if set
             if self.price_callback is not None:
                 self.set_price_callback(self.price_callback)
-            # Re-subscribe to all previous ticker channels if possible
-            if hasattr(self, 'last_subscribed_instrument') and self.last_subscribed_instrument:
-                await self.subscribe_to_ticker(self.last_subscribed_instrument)
-        except Exception as e:
-            logger.error(f"Reconnection failed: {e}")
-            await asyncio.sleep(5)  # Wait before retrying
+            # Re-subscribe every tracked instrument with one batched frame
+            saved = set(self.subscribed_instruments)
+            if self.last_subscribed_instrument:
+                saved.add(self.last_subscribed_instrument)
+            if saved:
+                self.subscribed_instruments.clear()  # subscribe_to_instruments diffs against this
+                await self.subscribe_to_instruments(saved)
+            return
+        logger.error("Giving up after %d reconnect attempts", self.RECONNECT_MAX_RETRIES)
 
     async def close(self):
         """Close both websocket connections"""
         self.running = False
+        if self._req_writer_task is not None:
+            self._req_writer_task.cancel()
         if self.req_ws:
             await self.req_ws.close()
         if self.sub_ws:
@@ -222,7 +397,7 @@ class DeribitWebsocketClient:
 
     async def send_request(self, method: str, params: dict) -> dict:
         """Send JSON-RPC request and await response via listener"""
-        req_id = next(self._id_counter)
+        req_id = self._acquire_slot()
         request = {
             "jsonrpc": "2.0",
             "id": req_id,
@@ -230,13 +405,48 @@ class DeribitWebsocketClient:
             "params": params
         }
         fut = asyncio.get_running_loop().create_future()
-        self.pending_requests[req_id] = fut
-        await self.req_ws.send(json.dumps(request))
+        self._pending_slots[req_id] = fut
+        self._req_send_q.put_nowait((req_id, _json_dumps(request)))
         try:
             response = await asyncio.wait_for(fut, timeout=10)
             return response
         finally:
-            self.pending_requests.pop(req_id, None)
+            self._pending_slots[req_id] = None
+
+    async def send_requests(self, calls, timeout: float = 10) -> list:
+        """Pipeline several JSON-RPC calls and await all responses together.
+
+        Every frame is enqueued before the first await, so the writer task
+        batches them into back-to-back sends instead of interleaving each
+        request with its round-trip (useful for option-chain snapshots).
+
+        Args:
+            calls: iterable of (method, params) pairs
+            timeout: seconds to wait for the full batch of responses
+
+        Returns:
+            list of response dicts, in call order
+        """
+        loop = asyncio.get_running_loop()
+        futures = []
+        req_ids = []
+        for method, params in calls:
+            req_id = self._acquire_slot()
+            fut = loop.create_future()
+            self._pending_slots[req_id] = fut
+            self._req_send_q.put_nowait((req_id, _json_dumps({
+                "jsonrpc": "2.0",
+                "id": req_id,
+                "method": method,
+                "params": params
+            })))
+            futures.append(fut)
+            req_ids.append(req_id)
+        try:
+            return await asyncio.wait_for(asyncio.gather(*futures), timeout=timeout)
+        finally:
+            for req_id in req_ids:
+                self._pending_slots[req_id] = None
 
     async def get_instrument_mark_price_and_iv(self, instrument_name: str, force_refresh: bool = False) -> tuple:
         """
@@ -250,12 +460,31 @@ class DeribitWebsocketClient:
         Returns:
             tuple: (mark_price, iv) where iv is 0 for futures, or (None, 0.0) on error
         """
-        # Check cache first if not forcing refresh
-        if not force_refresh and instrument_name in self.price_iv_cache:
-            cached = self.price_iv_cache[instrument_name]
-            logger.debug(f"Cache hit for {instrument_name}: {cached}")
-            return cached["mark_price"], cached["iv"]
+        # Check cache first if not forcing refresh (single .get, no membership probe)
+        if not force_refresh:
+            cached = self.price_iv_cache.get(instrument_name)
+            if cached is not None and time.monotonic_ns() - cached[2] <= self.PRICE_CACHE_TTL_NS:
+                logger.debug("Cache hit for %s", instrument_name)
+                iv = self._normalize_iv(cached[1])
+                return cached[0], 0.0 if iv is None else iv  # Futures cache no IV
+
+        # Single-flight: concurrent callers for the same instrument share one RPC
+        inflight = self._inflight_fetches.get(instrument_name)
+        if inflight is not None:
+            return await inflight
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight_fetches[instrument_name] = fut
+        try:
+            result = await self._fetch_mark_price_and_iv(instrument_name)
+            fut.set_result(result)
+            return result
+        finally:
+            self._inflight_fetches.pop(instrument_name, None)
+            if not fut.done():
+                fut.set_result((None, 0.0))
 
+    async def _fetch_mark_price_and_iv(self, instrument_name: str) -> tuple:
+        """Fetch (mark_price, iv) over the websocket; (None, 0.0) on error."""
         try:
             if not self.req_ws:
                 await self.connect()
@@ -271,25 +500,23 @@ class DeribitWebsocketClient:
                 mark_iv = result[0].get("mark_iv")
 
                 if mark_iv is not None:
-                    iv = mark_iv / 100 if mark_iv > 3 else mark_iv  # Deribit sometimes returns percent
+                    iv = self._normalize_iv(mark_iv)
                 else:
                     iv = 0.0  # Futures or missing IV
 
-                # Update cache
-                self.price_iv_cache[instrument_name] = {
-                    "mark_price": mark_price,
-                    "iv": iv,
-                    "timestamp": time.time()
-                }
+                # Cache the RAW mark_iv: every read path normalizes on the way
+                # out, so the cache must hold one unit (normalizing twice would
+                # shrink a 350% mark to 0.035)
+                self.price_iv_cache[instrument_name] = (mark_price, mark_iv, time.monotonic_ns())
 
-                logger.info(f"Fetched mark price for {instrument_name}: {mark_price}, IV: {iv}")
+                logger.info("Fetched mark price for %s: %s, IV: %s", instrument_name, mark_price, iv)
                 return mark_price, iv
 
-            logger.warning(f"No valid result for {instrument_name}: {result}")
+            logger.warning("No valid result for %s: %s", instrument_name, result)
             return None, 0.0
 
         except Exception as e:
-            logger.error(f"Error in get_instrument_mark_price_and_iv: {e}\n{traceback.format_exc()}")
+            logger.error("Error fetching mark price/IV: %s", e, exc_info=True)
             await self.reconnect()
             return None, 0.0
 
@@ -297,19 +524,33 @@ class DeribitWebsocketClient:
         """Set callback for price updates"""
         self.price_callback = callback
 
-    async def _handle_message(self, message: Dict):
-        """Handle incoming WebSocket messages"""
-        if message.get("method") == "subscription":
-            data = message.get("params", {}).get("data", {})
-            if "ticker" in message.get("params", {}).get("channel", ""):
-                instrument_name = data.get("instrument_name")
-                mark_price = data.get("mark_price")
-                mark_iv = data.get("mark_iv")
-                # Update cache
-                iv = None
-                if mark_iv is not None:
-                    iv = mark_iv / 100 if mark_iv > 3 else mark_iv
-                # logger.info(f"[DEBUG] Ticker update: {instrument_name}, mark_price={mark_price}, mark_iv={mark_iv}, iv={iv}")
-                self.price_iv_cache[instrument_name] = {"mark_price": mark_price, "iv": iv}
-                if self.price_callback and mark_price is not None:
-                    self.price_callback(instrument_name, mark_price)
+    def _handle_message(self, message: Dict):
+        """Dispatch an incoming frame to its channel handler (single O(1) lookup)"""
+        params = message.get("params")
+        if not params:
+            return
+        handler = self._channel_handlers.get(params.get("channel"))
+        if handler:
+            handler(params.get("data", {}))
+
+    def _handle_ticker_update(self, data: Dict):
+        """Handle one ticker subscription update: refresh cache, fire callback"""
+        mark_price = data.get("mark_price")
+        if mark_price is None:
+            return  # Nothing downstream can use a tick without a price
+        instrument_name = data.get("instrument_name")
+        # Cache the raw IV; normalization happens lazily in get_price_iv.
+        # monotonic_ns over time.time(): an int, immune to clock steps, and
+        # marginally cheaper per tick than allocating a fresh float
+        self.price_iv_cache[instrument_name] = (mark_price, data.get("mark_iv"), _monotonic_ns())
+        if len(self.price_iv_cache) > self.PRICE_CACHE_MAX:
+            self._prune_price_cache()
+        callback = self.price_callback
+        if callback is not None:
+            # Debounce: Deribit re-emits ticks with unchanged prices;
+            # skip the callback unless the price moved past epsilon
+            prev = self._last_callback_price.get(instrument_name)
+            if prev is not None and abs(mark_price - prev) <= self.price_epsilon:
+                return
+            self._last_callback_price[instrument_name] = mark_price
+            callback(instrument_name, mark_price)
@@ -3,7 +3,6 @@ from typing import Optional, Dict, List, Tuple, Any
 import time
 import logging
 import asyncio
-import math
 from decimal import Decimal, ROUND_HALF_UP
 
 from dneutral_sniper.deribit_client import DeribitWebsocketClient, DeribitCredentials
@@ -29,6 +28,7 @@ class HedgerConfig:
         volatility: Default annualized volatility (used as fallback)
         risk_free_rate: Risk-free rate for options pricing
         min_hedge_usd: Minimum USD notional for a hedge order
+        price_epsilon: Minimum absolute price move (USD) before a ticker update is propagated
     """
     ddh_min_trigger_delta: float
     ddh_target_delta: float
@@ -40,6 +40,7 @@ class HedgerConfig:
     volatility: float = 0.8  # Default annualized volatility for BTC
     risk_free_rate: float = 0.0  # Default risk-free rate
     min_hedge_usd: float = 10.0  # Minimum USD notional for a hedge order
+    price_epsilon: float = 0.0  # Min price move (USD) to re-fire the price callback
 
 class DynamicDeltaHedger:
     """Dynamic delta hedger that maintains delta neutrality for a portfolio of options.
@@ -59,23 +60,34 @@ class DynamicDeltaHedger:
         self.config = config
         self.portfolio = portfolio
         self.deribit_client = deribit_client
-        self.price_last = getattr(portfolio, 'last_hedge_price', None)
+        self.price_last = portfolio.last_hedge_price
 
         # State tracking
         self.ddh_enabled: bool = False
         self.ddh_pending: bool = False
         self.cur_delta: Optional[float] = None
         self.target_delta: float = self.config.ddh_target_delta if self.config.ddh_target_delta is not None else 0.0
-        self.last_hedge_time: Optional[float] = None
+        self._step_is_absolute: bool = self.config.ddh_step_mode == "absolute"
+        # Hedge notional rounding works in integer cents to dodge float ULP
+        # artifacts at lot boundaries (e.g. floor(99.9999999/10) -> 9 lots)
+        self._min_hedge_cents: int = int(round(self.config.min_hedge_usd * 100))
+        self.last_hedge_time: Optional[float] = None  # time.monotonic() basis
         self.hedge_count: int = 0
 
         # Initialize option model with deribit_client for mark price lookup
         self.option_model = OptionModel(self.portfolio, deribit_client=self.deribit_client)
 
-        # Price tracking
-        self.price_lock = asyncio.Lock()
+        # Price tracking. No lock: current_price is written only by the
+        # hedging loop's drain and read between awaits, and a float attribute
+        # swap is atomic under the GIL.
         self.current_price: Optional[float] = None
+        # Ticker updates arrive far more often than hedge checks run; they are
+        # queued here and coalesced to the latest value once per cycle
+        self._price_queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+        self._price_event = asyncio.Event()  # Woken by _price_callback; drives the loop
+        self._stop_event = asyncio.Event()
         self.deribit_client.set_price_callback(self._price_callback)
+        self.deribit_client.price_epsilon = self.config.price_epsilon
 
         # Statistics
         self.stats = {
@@ -84,6 +96,28 @@ class DynamicDeltaHedger:
             'total_usd_hedged': 0.0,
             'total_btc_hedged': 0.0,
         }
+        self._stats_snapshot: Optional[Dict[str, Any]] = None
+        self._stats_snapshot_time: float = 0.0
+
+    STATS_TTL = 1.0  # seconds a stats snapshot stays fresh for readouts
+
+    def get_hedger_stats(self) -> Dict[str, Any]:
+        """Return a snapshot of hedger statistics, memoized with a short TTL.
+
+        Callers polling for status readouts share one snapshot per TTL
+        window instead of rebuilding the dict on every call.
+        """
+        now = time.monotonic()
+        if self._stats_snapshot is not None and now - self._stats_snapshot_time < self.STATS_TTL:
+            return self._stats_snapshot
+        snapshot = dict(self.stats)
+        snapshot['hedge_count'] = self.hedge_count
+        snapshot['current_delta'] = self.cur_delta
+        snapshot['target_delta'] = self.target_delta
+        snapshot['is_hedging'] = self.ddh_enabled
+        self._stats_snapshot = snapshot
+        self._stats_snapshot_time = now
+        return snapshot
 
     async def start(self):
         """Start the dynamic delta hedger"""
@@ -99,43 +133,80 @@ class DynamicDeltaHedger:
     async def stop(self):
         """Stop the dynamic delta hedger"""
         self.ddh_enabled = False
+        self._stop_event.set()  # Wake the hedging loop immediately
         await self.deribit_client.close()
 
     def _price_callback(self, instrument_name: str, price: float):
-        """Callback for price updates from Deribit"""
+        """Callback for price updates from Deribit (sync: just enqueues)"""
         if instrument_name == self.config.instrument_name:
-            asyncio.create_task(self._update_price(price))
-
-    async def _update_price(self, price: float):
-        """Update current price with thread safety"""
-        async with self.price_lock:
-            self.current_price = price
+            try:
+                self._price_queue.put_nowait(price)
+            except asyncio.QueueFull:
+                # Drop the oldest update; only the latest price matters
+                self._price_queue.get_nowait()
+                self._price_queue.put_nowait(price)
+            self._price_event.set()
+
+    async def _drain_price_queue(self):
+        """Collapse all queued ticker updates into the latest price"""
+        latest = None
+        while True:
+            try:
+                latest = self._price_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        if latest is not None:
+            self.current_price = latest
 
     async def _run_hedging_loop(self):
-        """Main hedging loop"""
-        while self.ddh_enabled:
-            try:
-                await self._process_hedging_cycle()
-                await asyncio.sleep(self.config.price_check_interval)
-            except Exception as e:
-                logger.error(f"Error in hedging loop: {e}")
+        """Main hedging loop: evented, not polled.
+
+        Each cycle runs when a price tick arrives or the configured interval
+        elapses, whichever comes first, and stop() wakes the loop instantly
+        instead of waiting out the sleep.
+        """
+        stop_wait = asyncio.create_task(self._stop_event.wait())
+        try:
+            while self.ddh_enabled:
+                price_wait = asyncio.create_task(self._price_event.wait())
+                timer = asyncio.create_task(asyncio.sleep(self.config.price_check_interval))
+                try:
+                    await asyncio.wait(
+                        {stop_wait, price_wait, timer},
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                finally:
+                    # Also runs on external cancellation (e.g. signal-driven
+                    # shutdown) so the per-iteration tasks are never leaked
+                    price_wait.cancel()
+                    timer.cancel()
+                if self._stop_event.is_set():
+                    break
+                self._price_event.clear()
+                try:
+                    await self._process_hedging_cycle()
+                except Exception as e:
+                    logger.error("Error in hedging loop: %s", e)
+        finally:
+            stop_wait.cancel()
 
     async def _process_hedging_cycle(self):
         """Process single hedging cycle"""
+        await self._drain_price_queue()
         current_price = await self._get_current_price()
         if current_price is None:
             return
 
         # Only perform delta hedging if initial USD hedge is done
-        if not getattr(self.portfolio, 'initial_usd_hedged', False):
+        if not self.portfolio.initial_usd_hedged:
             logger.info("Initial USD notional hedge not completed, skipping dynamic delta hedging.")
             return
 
         if not self._should_process_hedge(current_price):
             return
 
-        await self._calculate_and_update_delta()
-        await self._execute_hedge_if_needed()
+        await self._calculate_and_update_delta(current_price)
+        await self._execute_hedge_if_needed(current_price)
 
     def _should_process_hedge(self, current_price: float) -> bool:
         """Check if we should process hedging based on price changes and other conditions.
@@ -154,14 +225,14 @@ class DynamicDeltaHedger:
             logger.debug("Price unchanged, skipping hedge check.")
             return False
 
-        # Calculate price change based on step mode
-        if self.config.ddh_step_mode == "absolute":
-            price_change = abs(current_price - self.price_last)
+        # Compare the raw price move against an absolute threshold; for
+        # percentage mode the decimal step size scales with the last price,
+        # which is equivalent to the pct comparison without the *100 dance
+        price_change = abs(current_price - self.price_last)
+        if self._step_is_absolute:
             threshold = self.config.ddh_step_size
-        else:  # percentage
-            price_change_pct = abs(current_price - self.price_last) / self.price_last
-            price_change = price_change_pct * 100  # Convert to percentage
-            threshold = self.config.ddh_step_size * 100  # Config is in decimal
+        else:  # percentage: config holds a decimal fraction
+            threshold = self.config.ddh_step_size * self.price_last
 
         # Check if we should hedge based on price movement
         should_hedge = price_change >= threshold
@@ -169,81 +240,80 @@ class DynamicDeltaHedger:
         # Also consider time-based hedging if we haven't hedged in a while
         time_based_hedge = None
         if not self.last_hedge_time:
-            time_since_last_hedge = time.time() - (self.last_hedge_time or 0)
+            time_since_last_hedge = time.monotonic() - (self.last_hedge_time or 0)
             time_based_hedge = time_since_last_hedge > (self.config.price_check_interval * 5)
 
         if should_hedge or time_based_hedge:
             logger.info(
-                f"Price change: {price_change:.6f} {'$' if self.config.ddh_step_mode == 'absolute' else '%'} "
-                f"(threshold: {threshold:.6f}), "
-                f"Hedging: {'YES' if should_hedge else 'TIME_BASED' if time_based_hedge else 'NO'}"
+                "Price change: $%.6f (threshold: $%.6f), Hedging: %s",
+                price_change, threshold,
+                'YES' if should_hedge else 'TIME_BASED' if time_based_hedge else 'NO',
             )
         else:
-            logger.info(f"Price change: {price_change:.2f} {'$' if self.config.ddh_step_mode == 'absolute' else '%'} (should_hedge: {should_hedge}, time_based_ hedge: {time_based_hedge})")
+            logger.info(
+                "Price change: $%.2f (should_hedge: %s, time_based_hedge: %s)",
+                price_change, should_hedge, time_based_hedge,
+            )
         return should_hedge or time_based_hedge
 
-    async def _calculate_and_update_delta(self) -> None:
+    async def _calculate_and_update_delta(self, current_price: float) -> None:
         """Calculate and update current net delta position.
 
         This calculates the portfolio's net delta in BTC, accounting for both
         inverse and standard options, as well as any existing futures positions.
+        The price is passed down from the cycle so every step works from the
+        same snapshot.
         """
-        current_price = await self._get_current_price()
-        if current_price is None:
-            logger.warning("Current price is None, skipping delta calculation.")
-            return
-
         logger.info("Calculating portfolio net delta...")
 
-        # Calculate net delta in BTC using IVs from Deribit
-        self.cur_delta = await self.option_model.calculate_portfolio_net_delta(
+        # Net delta (BTC) and USD PNL come from one fused portfolio sweep
+        self.cur_delta, usd_pnl = await self.option_model.calculate_portfolio_delta_and_pnl(
             current_price=current_price,
             volatility=self.config.volatility,
             risk_free_rate=self.config.risk_free_rate
         )
-
-        # Also calculate and log USD PNL
-        usd_pnl = await self.option_model.calculate_portfolio_usd_pnl(current_price)
         logger.info(
-            f"Portfolio delta: {self.cur_delta:.6f} BTC, "
-            f"USD PNL: ${usd_pnl:,.2f}, "
-            f"Price: ${current_price:,.2f}"
+            "Portfolio delta: %.6f BTC, USD PNL: $%.2f, Price: $%.2f",
+            self.cur_delta, usd_pnl, current_price,
         )
 
         return self.cur_delta
 
-    async def _execute_hedge_if_needed(self):
-        """Execute hedging if net delta difference exceeds threshold"""
+    async def _execute_hedge_if_needed(self, current_price: Optional[float] = None):
+        """Execute hedging if net delta difference exceeds threshold.
+
+        The hedging cycle passes its price snapshot down; direct callers may
+        omit it and the latest ticker price is used.
+        """
         if self.cur_delta is None or self.target_delta is None:
             return
 
-        hedge_price = await self._get_current_price()
-        if hedge_price is None:
-            logger.warning("Cannot execute hedge order: current price is None.")
-            return
+        if current_price is None:
+            current_price = await self._get_current_price()
+            if current_price is None:
+                logger.warning("Cannot execute hedge order: current price is None.")
+                return
         # Net delta is already calculated and stored in self.cur_delta
         required_hedge = self.target_delta - self.cur_delta
-        logger.info(f"[HEDGE DECISION] cur_delta={self.cur_delta}, target_delta={self.target_delta}, required_hedge={required_hedge}")
+        logger.info("[HEDGE DECISION] cur_delta=%s, target_delta=%s, required_hedge=%s",
+                    self.cur_delta, self.target_delta, required_hedge)
 
         if abs(required_hedge) >= self.config.ddh_min_trigger_delta:
-            await self._execute_hedge_order(required_hedge)
+            await self._execute_hedge_order(required_hedge, current_price)
         else:
             if not self.last_hedge_time:
-                self.last_hedge_time = time.time()
-            logger.info(f"Required net delta hedge {required_hedge} is less than min_trigger_delta {self.config.ddh_min_trigger_delta}, skipping hedge.")
+                self.last_hedge_time = time.monotonic()
+            logger.info("Required net delta hedge %s is less than min_trigger_delta %s, skipping hedge.",
+                        required_hedge, self.config.ddh_min_trigger_delta)
 
-    async def _execute_hedge_order(self, required_hedge: float) -> None:
+    async def _execute_hedge_order(self, required_hedge: float, current_price: float) -> None:
         """Execute a hedge order to adjust portfolio delta.
 
         Args:
             required_hedge: The amount of delta to hedge, in BTC. Positive means buy BTC,
                           negative means sell BTC.
+            current_price: Price snapshot the hedge decision was made at.
         """
-        current_price = await self._get_current_price()
-        if current_price is None:
-            logger.warning("Cannot execute hedge order: current price is None.")
-            return
-
         if abs(required_hedge) < 1e-8:  # Near zero
             logger.info("No hedge required (delta is effectively zero).")
             return
@@ -266,12 +336,13 @@ class DynamicDeltaHedger:
             )
             if not self.last_hedge_time:
                 # Still update the last_hedge_time to prevent immediate re-hedging
-                self.last_hedge_time = time.time()
+                self.last_hedge_time = time.monotonic()
                 return
 
-        # Round down to nearest min_hedge_usd to avoid odd lot sizes
-        # Using math.floor to always round down to the nearest multiple of min_hedge_usd
-        rounded_usd_qty = sign * (math.floor(abs_usd_qty / self.config.min_hedge_usd) * self.config.min_hedge_usd)
+        # Round down to the nearest min_hedge_usd multiple to avoid odd lot
+        # sizes, in integer cents so the division is exact
+        abs_cents = int(round(abs_usd_qty * 100))
+        rounded_usd_qty = sign * ((abs_cents // self._min_hedge_cents) * self._min_hedge_cents / 100.0)
 
         logger.info(
             f"Executing hedge: {'BUY' if rounded_usd_qty > 0 else 'SELL'} "
@@ -290,12 +361,10 @@ class DynamicDeltaHedger:
             self.stats['total_usd_hedged'] += abs(rounded_usd_qty)
             self.stats['total_btc_hedged'] += abs(rounded_usd_qty / current_price)
 
-            # Recalculate and update the portfolio delta
-            self.cur_delta = await self.option_model.calculate_portfolio_net_delta(
-                current_price=current_price,
-                volatility=self.config.volatility,
-                risk_free_rate=self.config.risk_free_rate
-            )
+            # Update the portfolio delta algebraically: option deltas are
+            # unchanged by a futures trade at the same price, so the hedge
+            # shifts net delta by exactly its BTC notional
+            self.cur_delta += rounded_usd_qty / current_price
 
             # Log hedge execution details
             logger.info(
@@ -311,7 +380,7 @@ class DynamicDeltaHedger:
             self.portfolio.save_to_file('portfolio.json')
 
             self.hedge_count += 1
-            self.last_hedge_time = time.time()
+            self.last_hedge_time = time.monotonic()
 
         except Exception as e:
             logger.error(f"Error executing hedge order: {e}", exc_info=True)
@@ -319,5 +388,4 @@ class DynamicDeltaHedger:
 
     async def _get_current_price(self) -> Optional[float]:
         """Get current price from the market"""
-        async with self.price_lock:
-            return self.current_price
+        return self.current_price
@@ -1,8 +1,7 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, Tuple
-import numpy as np
+import math
 from datetime import datetime
-from scipy.stats import norm
 from dneutral_sniper.portfolio import Portfolio
 from dneutral_sniper.models import OptionType, VanillaOption, ContractType
 import logging
@@ -11,32 +10,73 @@ from decimal import Decimal, ROUND_HALF_UP
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_INV_SQRT2 = 0.7071067811865476  # 1/sqrt(2), for the erfc-based normal CDF
+
+
+def _norm_cdf(x: float) -> float:
+    """Standard normal CDF via math.erfc.
+
+    Equivalent to scipy.stats.norm.cdf for scalars but avoids the frozen
+    distribution machinery, which is orders of magnitude slower per call.
+    """
+    return 0.5 * math.erfc(-x * _INV_SQRT2)
+
+
 class BlackScholesModel:
     @staticmethod
     def calculate_d1(S: float, K: float, T: float, r: float, sigma: float) -> float:
         """Calculate d1 parameter for Black-Scholes formula"""
         if T <= 0:
             return float('inf') if S > K else float('-inf')
-        return (np.log(S/K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+        return (math.log(S/K) + (r + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
 
     @staticmethod
     def calculate_d2(d1: float, sigma: float, T: float) -> float:
         """Calculate d2 parameter for Black-Scholes formula"""
-        return d1 - sigma * np.sqrt(T)
+        return d1 - sigma * math.sqrt(T)
 
     @staticmethod
     def calculate_delta(option_type: OptionType, d1: float) -> float:
         """Calculate option delta"""
         if option_type == OptionType.CALL:
-            return float(norm.cdf(d1))
+            return _norm_cdf(d1)
         else:
-            return float(norm.cdf(d1) - 1)
+            return _norm_cdf(d1) - 1
 
 class OptionModel:
+    DELTA_CACHE_MAX = 4096  # Bound on memoized Black-Scholes deltas
+
     def __init__(self, portfolio: Portfolio, deribit_client=None):
         self.portfolio = portfolio
         self.bs_model = BlackScholesModel()
         self.deribit_client = deribit_client  # For mark price lookup
+        self._delta_cache: Dict[tuple, float] = {}
+
+    def _bs_delta_bucketed(
+        self,
+        option_type: OptionType,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float
+    ) -> float:
+        """Black-Scholes delta memoized on quantized inputs.
+
+        Spot is bucketed to $1 and T/sigma to 4 decimals, so repeated ticks
+        inside a bucket reuse the cached delta instead of re-evaluating
+        norm.cdf per option. The delta is computed from the bucketed values,
+        keeping results deterministic per bucket.
+        """
+        key = (option_type, round(S), K, round(T, 4), r, round(sigma, 4))
+        delta = self._delta_cache.get(key)
+        if delta is None:
+            d1 = self.bs_model.calculate_d1(S=key[1], K=K, T=key[3], r=r, sigma=key[5])
+            delta = self.bs_model.calculate_delta(option_type, d1)
+            if len(self._delta_cache) >= self.DELTA_CACHE_MAX:
+                self._delta_cache.clear()  # Cheap wholesale reset; refills fast
+            self._delta_cache[key] = delta
+        return delta
 
     async def _get_mark_price_and_iv(self, option: VanillaOption) -> Tuple[float, float]:
         """Get mark price and IV for an option, with fallback to cache or config."""
@@ -76,15 +116,15 @@ class OptionModel:
         # Get IV from Deribit
         mark_price, iv = await self._get_mark_price_and_iv(option)
 
-        d1 = self.bs_model.calculate_d1(
-            S=current_price,
-            K=option.strike,
-            T=time_to_expiry,
-            r=risk_free_rate,
-            sigma=iv or volatility  # Fallback IV if not available
+        # Black-Scholes delta, memoized on price/T/IV buckets
+        bs_delta = self._bs_delta_bucketed(
+            option.option_type,
+            current_price,
+            option.strike,
+            time_to_expiry,
+            risk_free_rate,
+            iv or volatility  # Fallback IV if not available
         )
-        # Calculate standard Black-Scholes delta
-        bs_delta = self.bs_model.calculate_delta(option.option_type, d1)
 
         # For inverse options, adjust delta by subtracting mark price
         if option.contract_type == ContractType.INVERSE:
@@ -172,27 +212,94 @@ class OptionModel:
             total_usd_value += usd_value
 
             logger.info(
-                f"Option {option.instrument_name} ({option.contract_type.value}): "
-                f"type={option.option_type.value}, qty={option.quantity}, "
-                f"delta={delta:.6f}, mark_price={mark_price:.6f}, "
-                f"usd_value={usd_value:.2f}, position_delta_btc={position_delta_btc:.6f}"
+                "Option %s (%s): type=%s, qty=%s, delta=%.6f, mark_price=%.6f, "
+                "usd_value=%.2f, position_delta_btc=%.6f",
+                option.instrument_name, option.contract_type.value,
+                option.option_type.value, option.quantity,
+                delta, mark_price, usd_value, position_delta_btc,
             )
 
         # Add dynamic futures hedge (already in BTC)
-        dynamic_hedge_btc = getattr(self.portfolio, 'futures_position', 0.0) / current_price if current_price > 0 else 0.0
+        dynamic_hedge_btc = self.portfolio.futures_position / current_price if current_price > 0 else 0.0
         total_net_delta_btc += dynamic_hedge_btc
 
         # Optionally add static hedge if requested
         if include_static_hedge:
-            static_hedge_btc = getattr(self.portfolio, 'initial_usd_hedge_position', 0.0) / current_price if current_price > 0 else 0.0
+            static_hedge_btc = self.portfolio.initial_usd_hedge_position / current_price if current_price > 0 else 0.0
             total_net_delta_btc += static_hedge_btc
-            logger.info(f"Including static hedge in delta: {static_hedge_btc:.6f} BTC")
+            logger.info("Including static hedge in delta: %.6f BTC", static_hedge_btc)
         
-        logger.info(f"Dynamic futures hedge (BTC): {dynamic_hedge_btc:.6f}")
-        logger.info(f"Portfolio net delta (BTC): {total_net_delta_btc:.6f}")
+        logger.info("Dynamic futures hedge (BTC): %.6f", dynamic_hedge_btc)
+        logger.info("Portfolio net delta (BTC): %.6f", total_net_delta_btc)
 
         return total_net_delta_btc
 
+    async def calculate_portfolio_delta_and_pnl(
+        self,
+        current_price: float,
+        volatility: float,
+        risk_free_rate: float = 0.0
+    ) -> Tuple[float, float]:
+        """Compute net delta (BTC) and USD PNL in one pass over the portfolio.
+
+        calculate_portfolio_net_delta and calculate_portfolio_usd_pnl each
+        sweep the options and look up mark price/IV per leg; hedging cycles
+        need both numbers every time, so this fuses the two sweeps into a
+        single fetch and a single loop per leg.
+
+        Returns:
+            (net_delta_btc, total_pnl_usd)
+        """
+        current_time = datetime.now()
+        total_net_delta_btc = 0.0
+        total_pnl_usd = 0.0
+
+        for option in self.portfolio.list_options():
+            time_to_expiry = (option.expiry - current_time).total_seconds() / (365 * 24 * 3600)
+
+            mark_price, iv = await self._get_mark_price_and_iv(option)
+            option.mark_price = mark_price
+            option.iv = iv or volatility
+
+            if time_to_expiry <= 0:
+                delta = 0.0
+            else:
+                bs_delta = self._bs_delta_bucketed(
+                    option.option_type,
+                    current_price,
+                    option.strike,
+                    time_to_expiry,
+                    risk_free_rate,
+                    iv or volatility
+                )
+                # Inverse options quote delta net of the BTC-denominated premium
+                delta = bs_delta - mark_price if option.contract_type == ContractType.INVERSE else bs_delta
+
+            usd_value = self._calculate_option_usd_value(option, current_price, mark_price, delta)
+            option.usd_value = usd_value
+            option.delta = delta
+            option._greeks_calculated = True
+
+            if option.contract_type == ContractType.INVERSE:
+                position_delta_btc = delta * option.quantity
+            else:
+                position_delta_btc = (delta * option.quantity) / current_price if current_price > 0 else 0
+            total_net_delta_btc += position_delta_btc
+
+            initial_value = self.portfolio.initial_option_usd_value.get(option.instrument_name, 0.0)
+            total_pnl_usd += usd_value - initial_value
+
+        # Dynamic futures hedge: delta in BTC plus PNL against the avg entry
+        total_net_delta_btc += self.portfolio.futures_position / current_price if current_price > 0 else 0.0
+
+        futures_position = self.portfolio.futures_position
+        futures_avg_entry = self.portfolio.futures_avg_entry
+        if futures_position != 0 and futures_avg_entry > 0:
+            total_pnl_usd += (current_price - futures_avg_entry) * futures_position / futures_avg_entry
+
+        logger.info("Portfolio net delta (BTC): %.6f, USD PNL: $%.2f", total_net_delta_btc, total_pnl_usd)
+        return total_net_delta_btc, total_pnl_usd
+
     async def calculate_portfolio_usd_pnl(self, current_price: float) -> float:
         """
         Calculate total portfolio PNL in USD.
@@ -230,20 +337,19 @@ class OptionModel:
             total_pnl_usd += pnl
 
             logger.debug(
-                f"Option {option.instrument_name} PNL: "
-                f"initial=${initial_value:.2f}, current=${current_value:.2f}, "
-                f"PNL=${pnl:.2f}"
+                "Option %s PNL: initial=$%.2f, current=$%.2f, PNL=$%.2f",
+                option.instrument_name, initial_value, current_value, pnl,
             )
 
         # Calculate PNL from futures positions
-        futures_position = getattr(self.portfolio, 'futures_position', 0.0)
-        futures_avg_entry = getattr(self.portfolio, 'futures_avg_entry', 0.0)
+        futures_position = self.portfolio.futures_position
+        futures_avg_entry = self.portfolio.futures_avg_entry
 
         if futures_position != 0 and futures_avg_entry > 0:
             # PNL = (current_price - avg_entry) * position_size
             futures_pnl = (current_price - futures_avg_entry) * futures_position / futures_avg_entry
             total_pnl_usd += futures_pnl
-            logger.debug(f"Futures PNL: ${futures_pnl:.2f}")
+            logger.debug("Futures PNL: $%.2f", futures_pnl)
 
-        logger.info(f"Total portfolio PNL: ${total_pnl_usd:.2f}")
+        logger.info("Total portfolio PNL: $%.2f", total_pnl_usd)
         return total_pnl_usd
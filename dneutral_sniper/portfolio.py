@@ -2,6 +2,11 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import json
 import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from dneutral_sniper.models import OptionType, VanillaOption, ContractType
 
 logger = logging.getLogger(__name__)
@@ -12,13 +17,13 @@ class Portfolio:
         data = {
             "futures_position": self.futures_position,
             "futures_avg_entry": self.futures_avg_entry,
-            "last_hedge_price": getattr(self, 'last_hedge_price', None),
-            "realized_pnl": getattr(self, 'realized_pnl', 0.0),
-            "initial_option_usd_value": getattr(self, 'initial_option_usd_value', {}),
-            "trades": getattr(self, 'trades', []),
-            "initial_usd_hedged": getattr(self, 'initial_usd_hedged', False),
-            "initial_usd_hedge_position": getattr(self, 'initial_usd_hedge_position', 0.0),
-            "initial_usd_hedge_avg_entry": getattr(self, 'initial_usd_hedge_avg_entry', 0.0),
+            "last_hedge_price": self.last_hedge_price,
+            "realized_pnl": self.realized_pnl,
+            "initial_option_usd_value": self.initial_option_usd_value,
+            "trades": self.trades,
+            "initial_usd_hedged": self.initial_usd_hedged,
+            "initial_usd_hedge_position": self.initial_usd_hedge_position,
+            "initial_usd_hedge_avg_entry": self.initial_usd_hedge_avg_entry,
             "options": [
                 {
                     "instrument_name": o.instrument_name,
@@ -36,8 +41,14 @@ class Portfolio:
                 for o in self.options.values()
             ]
         }
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        # save_to_file runs on the hedge path after every executed order, so
+        # encode with orjson when available (single bytes write, ~5x faster)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=2)
 
 
 
@@ -46,8 +57,8 @@ class Portfolio:
         """Load portfolio positions, last_hedge_price, realized_pnl, initial_option_usd_value, and trades from a JSON file"""
         portfolio = Portfolio()
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                data = orjson.loads(f.read()) if orjson is not None else json.load(f)
             portfolio.futures_position = data.get("futures_position", 0.0)
             portfolio.futures_avg_entry = data.get("futures_avg_entry", 0.0)
             portfolio.last_hedge_price = data.get("last_hedge_price", None)
@@ -184,10 +195,6 @@ class Portfolio:
         """
         from datetime import datetime
         self.last_hedge_price = price
-        if not hasattr(self, 'realized_pnl'):
-            self.realized_pnl = 0.0
-        if not hasattr(self, 'trades'):
-            self.trades = []
         side = 'buy' if quantity > 0 else 'sell'
         realized_pnl_before = self.realized_pnl
         if self.futures_position == 0:
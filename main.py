@@ -1,9 +1,16 @@
 import asyncio
 import logging
+import signal
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None  # uvloop is optional (POSIX-only); fall back to the default loop
+
 from dneutral_sniper.dynamic_delta_hedger import DynamicDeltaHedger, HedgerConfig
 from dneutral_sniper.deribit_client import DeribitWebsocketClient
 from dneutral_sniper.portfolio import Portfolio
@@ -107,49 +114,57 @@ async def initialize_usd_value_hedged_strangle(
         current_price = futures_mark_price
     logger.info(f"Using current price: ${current_price:,.2f}")
 
-    # Create and add call option
-    call_option = await create_option(
-        deribit_client=deribit_client,
-        option_type=OptionType.CALL,
-        strike=call_strike,
-        expiry=expiry,
-        quantity=quantity,
-        contract_type=contract_type
+    # Create both legs concurrently; each creation awaits a network round-trip
+    call_option, put_option = await asyncio.gather(
+        create_option(
+            deribit_client=deribit_client,
+            option_type=OptionType.CALL,
+            strike=call_strike,
+            expiry=expiry,
+            quantity=quantity,
+            contract_type=contract_type
+        ),
+        create_option(
+            deribit_client=deribit_client,
+            option_type=OptionType.PUT,
+            strike=put_strike,
+            expiry=expiry,
+            quantity=quantity,
+            contract_type=contract_type
+        ),
     )
 
-    if call_option:
-        call_price_btc, _ = await deribit_client.get_instrument_mark_price_and_iv(call_option.instrument_name)
-        if call_price_btc is not None:
-            call_usd_value = call_option.quantity * call_price_btc * current_price
-            portfolio.add_option(call_option, premium_usd=call_usd_value)
-            logger.info(f"Added call option: {call_option}")
-            logger.info(
-                f"Hedging USD value of call: {'Buy' if call_option.quantity > 0 else 'Sell'} "
-                f"${call_usd_value:,.2f} notional of BTC-PERPETUAL "
-                f"(price: {call_price_btc:.8f} BTC)"
-            )
+    async def fetch_mark_price(option: Optional[VanillaOption]) -> Optional[float]:
+        if option is None:
+            return None
+        mark_price, _ = await deribit_client.get_instrument_mark_price_and_iv(option.instrument_name)
+        return mark_price
 
-    # Create and add put option
-    put_option = await create_option(
-        deribit_client=deribit_client,
-        option_type=OptionType.PUT,
-        strike=put_strike,
-        expiry=expiry,
-        quantity=quantity,
-        contract_type=contract_type
+    # Fetch both mark prices in parallel as well
+    call_price_btc, put_price_btc = await asyncio.gather(
+        fetch_mark_price(call_option),
+        fetch_mark_price(put_option),
     )
 
-    if put_option:
-        put_price_btc, _ = await deribit_client.get_instrument_mark_price_and_iv(put_option.instrument_name)
-        if put_price_btc is not None:
-            put_usd_value = put_option.quantity * put_price_btc * current_price
-            portfolio.add_option(put_option, premium_usd=put_usd_value)
-            logger.info(f"Added put option: {put_option}")
-            logger.info(
-                f"Hedging USD value of put: {'Buy' if put_option.quantity > 0 else 'Sell'} "
-                f"${put_usd_value:,.2f} notional of BTC-PERPETUAL "
-                f"(price: {put_price_btc:.8f} BTC)"
-            )
+    if call_option and call_price_btc is not None:
+        call_usd_value = call_option.quantity * call_price_btc * current_price
+        portfolio.add_option(call_option, premium_usd=call_usd_value)
+        logger.info(f"Added call option: {call_option}")
+        logger.info(
+            f"Hedging USD value of call: {'Buy' if call_option.quantity > 0 else 'Sell'} "
+            f"${call_usd_value:,.2f} notional of BTC-PERPETUAL "
+            f"(price: {call_price_btc:.8f} BTC)"
+        )
+
+    if put_option and put_price_btc is not None:
+        put_usd_value = put_option.quantity * put_price_btc * current_price
+        portfolio.add_option(put_option, premium_usd=put_usd_value)
+        logger.info(f"Added put option: {put_option}")
+        logger.info(
+            f"Hedging USD value of put: {'Buy' if put_option.quantity > 0 else 'Sell'} "
+            f"${put_usd_value:,.2f} notional of BTC-PERPETUAL "
+            f"(price: {put_price_btc:.8f} BTC)"
+        )
 
     # Calculate total USD hedge amount with correct sign
     # If we sold options (positive premium), we need to buy USD hedge (positive notional)
@@ -189,6 +204,17 @@ async def main():
     """Main entry point for the DNEUTRAL SNIPER application."""
     logger.info("DNEUTRAL SNIPER started")
 
+    # Graceful shutdown: signals set an event the loop observes, so the
+    # websocket close frame and portfolio save still run instead of being
+    # cut off by sys.exit from inside a signal handler.
+    shutdown_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, shutdown_event.set)
+        except NotImplementedError:
+            pass  # add_signal_handler is unavailable on Windows event loops
+
     # Initialize configuration
     portfolio_file = CONFIG["portfolio_file"]
     contract_type = ContractType.INVERSE if CONFIG["contract_type"].lower() == "inverse" else ContractType.STANDARD
@@ -233,7 +259,7 @@ async def main():
 
         # Get unique underlyings from portfolio options
         underlyings = set()
-        if hasattr(portfolio, 'options') and portfolio.options:
+        if portfolio.options:
             for option in portfolio.options.values():
                 underlyings.add(option.underlying.split('-')[0].upper())
 
@@ -243,7 +269,7 @@ async def main():
             instrument_names.add(get_perpetual_contract(underlying))
 
         # Add all option instruments
-        if hasattr(portfolio, 'options') and portfolio.options:
+        if portfolio.options:
             instrument_names.update(option.instrument_name for option in portfolio.options.values())
 
         logger.debug(f"Generated instrument names for subscription: {instrument_names}")
@@ -269,7 +295,18 @@ async def main():
 
         try:
             logger.info("Starting dynamic delta hedger...")
-            await hedger.start()
+            hedger_task = asyncio.create_task(hedger.start())
+            shutdown_wait = asyncio.create_task(shutdown_event.wait())
+            done, pending = await asyncio.wait(
+                {hedger_task, shutdown_wait},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in pending:
+                task.cancel()
+            if shutdown_wait in done:
+                logger.info("Received shutdown signal, stopping...")
+            elif hedger_task.exception() is not None:
+                raise hedger_task.exception()
         except asyncio.CancelledError:
             logger.info("Received shutdown signal, stopping...")
             raise
@@ -0,0 +1,105 @@
+import asyncio
+import pytest
+from dneutral_sniper.deribit_client import DeribitWebsocketClient
+
+
+def _drain_queued_ids(client):
+    """Pull every queued (req_id, frame) pair and return the req_ids."""
+    ids = []
+    while not client._req_send_q.empty():
+        req_id, _frame = client._req_send_q.get_nowait()
+        ids.append(req_id)
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_send_requests_pipelines_and_returns_in_order():
+    client = DeribitWebsocketClient()
+    task = asyncio.create_task(client.send_requests([
+        ("public/get_book_summary_by_instrument", {"instrument_name": "BTC-A"}),
+        ("public/get_book_summary_by_instrument", {"instrument_name": "BTC-B"}),
+    ]))
+    await asyncio.sleep(0)  # let send_requests enqueue and park on gather
+
+    ids = _drain_queued_ids(client)
+    # All frames were enqueued before the first await (pipelined, not serial)
+    assert len(ids) == 2
+    # Resolve out of order; responses must still come back in call order
+    client._pending_slots[ids[1]].set_result({"id": ids[1], "result": "B"})
+    client._pending_slots[ids[0]].set_result({"id": ids[0], "result": "A"})
+
+    responses = await task
+    assert [r["result"] for r in responses] == ["A", "B"]
+    # Slots are released once the batch completes
+    assert all(client._pending_slots[i] is None for i in ids)
+
+
+@pytest.mark.asyncio
+async def test_send_requests_propagates_single_failure():
+    client = DeribitWebsocketClient()
+    task = asyncio.create_task(client.send_requests([
+        ("public/test", {}),
+        ("public/test", {}),
+    ]))
+    await asyncio.sleep(0)
+
+    ids = _drain_queued_ids(client)
+    client._pending_slots[ids[0]].set_result({"id": ids[0], "result": "ok"})
+    client._pending_slots[ids[1]].set_exception(ConnectionResetError("send failed"))
+
+    with pytest.raises(ConnectionResetError):
+        await task
+    # Slots are released even when one request in the batch fails
+    assert all(client._pending_slots[i] is None for i in ids)
+
+
+@pytest.mark.asyncio
+async def test_send_requests_times_out_and_releases_slots():
+    client = DeribitWebsocketClient()
+    task = asyncio.create_task(client.send_requests(
+        [("public/test", {})],
+        timeout=0.05,
+    ))
+    await asyncio.sleep(0)
+
+    ids = _drain_queued_ids(client)
+    # Never resolve the future: the batch must time out, not hang
+    with pytest.raises(asyncio.TimeoutError):
+        await task
+    assert all(client._pending_slots[i] is None for i in ids)
+
+
+def test_percent_iv_normalized_once_via_get_price_iv():
+    """A percent-scale mark_iv is cached raw and normalized exactly once."""
+    client = DeribitWebsocketClient()
+    client._handle_ticker_update(
+        {"instrument_name": "BTC-TEST-C", "mark_price": 0.05, "mark_iv": 350.0}
+    )
+    price, iv = client.get_price_iv("BTC-TEST-C")
+    assert price == 0.05
+    assert abs(iv - 3.5) < 1e-12
+
+
+@pytest.mark.asyncio
+async def test_percent_iv_normalized_once_on_cache_hit():
+    """Repeated cache hits must not re-normalize (350% -> 3.5, never 0.035)."""
+    client = DeribitWebsocketClient()
+    client._handle_ticker_update(
+        {"instrument_name": "BTC-TEST-C", "mark_price": 0.05, "mark_iv": 350.0}
+    )
+    for _ in range(2):
+        price, iv = await client.get_instrument_mark_price_and_iv("BTC-TEST-C")
+        assert price == 0.05
+        assert abs(iv - 3.5) < 1e-12
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_returns_zero_iv_for_futures():
+    """Futures carry no mark_iv; the cache-hit path keeps the iv=0 contract."""
+    client = DeribitWebsocketClient()
+    client._handle_ticker_update(
+        {"instrument_name": "BTC-PERPETUAL", "mark_price": 50000.0}
+    )
+    price, iv = await client.get_instrument_mark_price_and_iv("BTC-PERPETUAL")
+    assert price == 50000.0
+    assert iv == 0.0
@@ -216,3 +216,39 @@ async def test_hedge_direction_after_fix():
     assert portfolio.futures_position > 0
     # Expected: 0.25 BTC * $100 = $25, rounded down to nearest $10 is $20
     assert portfolio.hedge_calls[-1][0] == 20.0
+
+@pytest.mark.asyncio
+async def test_hedge_rounding_at_lot_boundary():
+    """Regression test for integer-cents lot rounding.
+
+    Float floor(99.9999999 / 10) lands one lot short because the quotient
+    sits an ULP below 10; the cents-based rounding must book the full lot.
+    """
+    config = HedgerConfig(
+        ddh_min_trigger_delta=0.01,
+        ddh_target_delta=0.0,
+        ddh_step_mode="absolute",
+        ddh_step_size=1,
+        instrument_name="BTC-PERPETUAL",
+        volatility=0.4,
+        price_check_interval=0.1,
+        min_hedge_usd=10.0
+    )
+    portfolio = DummyPortfolio()
+    client = DummyDeribitClient()
+    hedger = DynamicDeltaHedger(config, portfolio, client)
+    hedger._get_current_price = AsyncMock(return_value=100.0)
+    hedger.target_delta = 0.0
+
+    # 0.999999999 BTC * $100 = $99.9999999: an ULP shy of ten $10 lots,
+    # which must round to $100, not $90
+    hedger.cur_delta = -0.999999999
+    await hedger._execute_hedge_if_needed()
+    assert portfolio.hedge_calls[-1] == (100.0, 100.0)
+
+    # Amounts genuinely inside a lot still round down
+    portfolio.hedge_calls.clear()
+    hedger.cur_delta = -0.349
+    await hedger._execute_hedge_if_needed()
+    # required_hedge = 0.349, usd_qty = 34.9, rounded down to 30
+    assert portfolio.hedge_calls[-1] == (30.0, 100.0)